@@ -1,19 +1,20 @@
 """Save example figures for the report."""
 import os
+import argparse
 import numpy as np
 from src.main import load_data, preprocess, choose_metric
 from src.dnc_cluster import DnCClusterer
 from src.closest_pair import closest_pair_bruteforce
 from src.similarity import DistStats
-from src.visualize import plot_cluster_examples, plot_pair, plot_kadane_interval
-from src.kadane import find_max_subarray
+from src.visualize import plot_cluster_report, plot_pair, plot_kadane_interval
+from src.kadane import activity_signal, kadane_max_subarray
 
 def main():
     # Create results directory
     os.makedirs("results", exist_ok=True)
     
     # Load and preprocess toy data
-    X = load_data(None)  # use built-in toy data
+    X = load_data(argparse.Namespace(data=None))  # use built-in toy data
     X = preprocess(X, subset=100)
     
     # Set up clustering with stats
@@ -33,12 +34,13 @@ def main():
     leaves = DnCClusterer.collect_leaves(tree)
     print(f"✅ Found {len(leaves)} clusters")
     
-    # Save cluster examples
-    plot_cluster_examples(
-        leaves, n_per_cluster=3,
+    # Save cluster examples (paginated, rendered in parallel) plus previews
+    pages = plot_cluster_report(
+        leaves, "results", n_per_cluster=3,
         suptitle="Example segments from each cluster",
-        save_path="results/clusters.png"
+        preview_points=64
     )
+    print(f"✅ Wrote {len(pages)} cluster figures")
     
     # Save closest pair from largest cluster
     if len(leaves) > 0 and leaves[0].shape[0] >= 2:
@@ -51,7 +53,7 @@ def main():
     
     # Save Kadane interval example
     x = X[0]  # first segment
-    start, end = find_max_subarray(x)
+    _, start, end = kadane_max_subarray(activity_signal(x))
     plot_kadane_interval(
         x, start, end,
         title=f"Kadane interval for first segment",
@@ -1,7 +1,12 @@
 from __future__ import annotations
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from typing import List, Optional, Tuple
 
 
 """Simple plotting helpers used by the project.
@@ -43,6 +48,181 @@ def plot_cluster_examples(leaves: List[np.ndarray], n_per_cluster: int = 3, supt
         plt.show()
 
 
+# Fast zlib level: report pages are large and mostly empty, so the default
+# level spends far longer compressing than drawing for a few percent of size.
+_PNG_KWARGS = {"compress_level": 1}
+
+
+def _example_indices(n: int, k: int) -> np.ndarray:
+    """Evenly spaced row indices (same choice as plot_cluster_examples)."""
+    return np.linspace(0, n - 1, min(k, n), dtype=int)
+
+
+def downsample(x: np.ndarray, n_points: int) -> np.ndarray:
+    """Shrink the last axis to at most n_points by averaging equal-width bins.
+
+    Works on a single signal or a 2D (segments x time) array.
+    """
+    T = x.shape[-1]
+    if n_points <= 0 or T <= n_points:
+        return x
+    edges = np.linspace(0, T, n_points + 1).astype(int)
+    sums = np.add.reduceat(x, edges[:-1], axis=-1)
+    return sums / np.diff(edges)
+
+
+def _segments(Y: np.ndarray, x0: float = 0.0, y0: float = 0.0,
+              w: Optional[float] = None, h: Optional[float] = None) -> np.ndarray:
+    """Turn a (k, T) array into the (k, T, 2) vertex array LineCollection wants.
+
+    If w and h are given the rows are scaled to fit the box at (x0, y0) so many
+    clusters can share one axes.
+    """
+    k, T = Y.shape
+    xs = np.broadcast_to(np.arange(T, dtype=float), (k, T))
+    ys = Y.astype(float)
+    if w is not None and h is not None:
+        xs = x0 + xs * (w / max(T - 1, 1))
+        lo, hi = ys.min(), ys.max()
+        ys = y0 + (ys - lo) * (h / (hi - lo) if hi > lo else 0.0) + (0.0 if hi > lo else h / 2)
+    return np.stack([xs, ys], axis=-1)
+
+
+def _blank_axes(fig: Figure, rect=(0, 0, 1, 1)):
+    """One frameless axes covering rect; cheaper than a subplot per panel."""
+    ax = fig.add_axes(rect)
+    ax.set_axis_off()
+    return ax
+
+
+def _render_cluster_page(job: Tuple) -> str:
+    """Render one page of the cluster report to a PNG (runs in a worker).
+
+    All clusters on the page live in a grid of cells on a single axes and every
+    segment is drawn through one LineCollection, so the cost is one draw call
+    rather than one subplot per cluster. Uses a bare Figure with the Agg canvas
+    so no pyplot state or GUI backend is touched.
+    """
+    examples, sizes, first_id, cols, suptitle, dpi, save_path = job
+    rows = (len(examples) + cols - 1) // cols
+    top = 0.4 if suptitle else 0.0
+    fig = Figure(figsize=(3 * cols, 2 * rows + top))
+    FigureCanvasAgg(fig)
+    ax = _blank_axes(fig, (0.0, 0.0, 1.0, 2 * rows / (2 * rows + top)))
+    ax.set_xlim(0, cols)
+    ax.set_ylim(-rows, 0)
+    # no point drawing more vertices than the cell has pixels across
+    cell_px = int(3 * 0.9 * dpi)
+    verts, labels = [], []
+    for k, Y in enumerate(examples):
+        r, c = divmod(k, cols)
+        if Y.size:
+            verts.append(_segments(downsample(Y, cell_px), c + 0.05, -r - 0.95, 0.9, 0.75))
+        labels.append((c + 0.5, -r - 0.08, f"cluster {first_id + k} (n={sizes[k]})"))
+    if verts:
+        # segments can differ in length between clusters, so pass a flat list
+        ax.add_collection(LineCollection([v for V in verts for v in V], linewidths=0.8, alpha=0.7))
+    for x, y, text in labels:
+        ax.text(x, y, text, ha="center", va="center", fontsize=8)
+    if suptitle:
+        fig.suptitle(suptitle, y=1 - 0.15 / (2 * rows + top))
+    fig.savefig(save_path, dpi=dpi, pil_kwargs=_PNG_KWARGS)
+    return save_path
+
+
+def _render_cluster_previews(jobs: List[Tuple]) -> List[str]:
+    """Render small downsampled overviews of clusters with their mean trace.
+
+    One figure is reused for the whole batch and only the artists' data is
+    swapped, since building the axes costs about as much as drawing a preview.
+    """
+    fig = Figure(figsize=(3, 2))
+    FigureCanvasAgg(fig)
+    ax = _blank_axes(fig, (0.03, 0.03, 0.94, 0.82))
+    lines = LineCollection([], linewidths=0.5, alpha=0.3, colors="tab:blue")
+    ax.add_collection(lines)
+    mean, = ax.plot([], [], color="black", lw=1.2)
+    title = fig.text(0.5, 0.93, "", ha="center", va="center", fontsize=8)
+    paths = []
+    for Y, cluster_id, dpi, save_path in jobs:
+        if Y.size:
+            lines.set_segments(_segments(Y))
+            mean.set_data(np.arange(Y.shape[1]), Y.mean(axis=0))
+            lo, hi = float(Y.min()), float(Y.max())
+            pad = 0.05 * (hi - lo) or 0.5
+            ax.set_xlim(0, max(Y.shape[1] - 1, 1))
+            ax.set_ylim(lo - pad, hi + pad)
+        else:
+            lines.set_segments([])
+            mean.set_data([], [])
+        title.set_text(f"cluster {cluster_id} (n={Y.shape[0]})")
+        fig.savefig(save_path, dpi=dpi, pil_kwargs=_PNG_KWARGS)
+        paths.append(save_path)
+    return paths
+
+
+def plot_cluster_report(leaves: List[np.ndarray], out_dir: str, n_per_cluster: int = 8,
+                        clusters_per_page: int = 48, cols: int = 6, suptitle: str = "",
+                        prefix: str = "clusters", preview_points: Optional[int] = None,
+                        preview_batch: int = 32, workers: Optional[int] = None,
+                        dpi: int = 100) -> List[str]:
+    """Headless, paginated version of plot_cluster_examples for large runs.
+
+    Each cluster gets a cell with its example segments overlaid (drawn through
+    batched LineCollections rather than one subplot each), clusters are split
+    across ``<prefix>_pNNN.png`` pages and the pages are rendered in a process
+    pool on the Agg backend.
+
+    Args:
+        leaves: list of numpy arrays (each array is a cluster of segments).
+        out_dir: directory to write the PNGs into (created if missing).
+        n_per_cluster: how many examples to draw per cluster.
+        clusters_per_page: how many clusters go on one page.
+        cols: clusters per row on a page.
+        suptitle: title put on every page.
+        prefix: file name prefix for the pages.
+        preview_points: if set, also write ``<prefix>_previews/cluster_NNN.png``
+            showing all segments of each cluster downsampled to this many points.
+        preview_batch: previews rendered per task (each task reuses one figure).
+        workers: process count; 1 renders in-process, None lets the pool decide.
+        dpi: resolution of the saved PNGs.
+
+    Returns:
+        Paths of the written files (pages first, then previews).
+    """
+    if len(leaves) == 0:
+        return []
+    os.makedirs(out_dir, exist_ok=True)
+    cols = max(1, min(cols, clusters_per_page))
+    # Only ship the rows we actually draw to the workers, not whole clusters.
+    examples = [Xc[_example_indices(Xc.shape[0], n_per_cluster)] for Xc in leaves]
+    sizes = [int(Xc.shape[0]) for Xc in leaves]
+    page_jobs = []
+    for p, start in enumerate(range(0, len(leaves), clusters_per_page)):
+        stop = start + clusters_per_page
+        path = os.path.join(out_dir, f"{prefix}_p{p:03d}.png")
+        page_jobs.append((examples[start:stop], sizes[start:stop], start, cols, suptitle, dpi, path))
+
+    preview_jobs = []
+    if preview_points:
+        preview_dir = os.path.join(out_dir, f"{prefix}_previews")
+        os.makedirs(preview_dir, exist_ok=True)
+        for ci, Xc in enumerate(leaves):
+            path = os.path.join(preview_dir, f"cluster_{ci:03d}.png")
+            preview_jobs.append((downsample(Xc, preview_points), ci, dpi, path))
+
+    preview_batches = [preview_jobs[i:i + preview_batch] for i in range(0, len(preview_jobs), preview_batch)]
+    if workers == 1 or len(page_jobs) + len(preview_batches) == 1:
+        paths = [_render_cluster_page(j) for j in page_jobs]
+        for batch in preview_batches:
+            paths += _render_cluster_previews(batch)
+        return paths
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pages = pool.map(_render_cluster_page, page_jobs)
+        previews = pool.map(_render_cluster_previews, preview_batches)
+        return list(pages) + [p for batch in previews for p in batch]
+
+
 def plot_pair(x: np.ndarray, y: np.ndarray, title: str = "Closest Pair", save_path: Optional[str] = None):
     """Plot two signals on the same axes (used for representative pairs).
 